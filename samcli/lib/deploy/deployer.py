@@ -15,6 +15,7 @@ Cloudformation deploy class which also streams events and changeset information
 # ANY KIND, either express or implied. See the License for the specific
 # language governing permissions and limitations under the License.
 
+import os
 import sys
 import math
 from collections import OrderedDict
@@ -451,9 +452,17 @@ class Deployer:
         else:
             raise RuntimeError("Invalid stack operation type {0}".format(stack_operation))
 
-        # Poll every 30 seconds. Polling too frequently risks hitting rate limits
-        # on CloudFormation's DescribeStacks API
-        waiter_config = {"Delay": 30, "MaxAttempts": 120}
+        # Poll every 30 seconds by default. Polling too frequently risks hitting rate limits
+        # on CloudFormation's DescribeStacks API. SAM_CLI_POLL_DELAY can lower the delay
+        # (integration tests use it); the attempt count is scaled so the total wait time
+        # stays at least an hour.
+        try:
+            delay = int(os.environ.get("SAM_CLI_POLL_DELAY", "30"))
+        except ValueError:
+            delay = 30
+        if delay <= 0:
+            delay = 30
+        waiter_config = {"Delay": delay, "MaxAttempts": max(120, 3600 // delay)}
 
         try:
             waiter.wait(StackName=stack_name, WaiterConfig=waiter_config)
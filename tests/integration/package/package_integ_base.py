@@ -13,10 +13,18 @@ from samcli.lib.bootstrap.companion_stack.data_types import CompanionStack
 CFN_PYTHON_VERSION_SUFFIX = os.environ.get("PYTHON_VERSION", "0.0.0").replace(".", "-")
 SLEEP = 3
 
+# Buckets and ECR repos we create ourselves are cached at module scope so every test
+# class that runs setUpClass in this process shares one set instead of provisioning
+# its own copy per class
+_SELF_MANAGED_BUCKET_NAME = None
+_SELF_MANAGED_ECR_REPO_URI = None
+
 
 class PackageIntegBase(TestCase):
     @classmethod
     def setUpClass(cls):
+        global _SELF_MANAGED_BUCKET_NAME, _SELF_MANAGED_ECR_REPO_URI
+
         cls.region_name = os.environ.get("AWS_DEFAULT_REGION")
         """
         Our integration tests use S3 bucket and ECR Repo to run several tests.
@@ -56,6 +64,11 @@ class PackageIntegBase(TestCase):
             cls.pre_created_ecr_repo if cls.pre_created_ecr_repo else str(uuid.uuid4()).replace("-", "")[:10]
         )
         cls.bucket_name = cls.pre_created_bucket if cls.pre_created_bucket else str(uuid.uuid4())
+        # Reuse resources provisioned by an earlier test class in this process
+        if not cls.pre_created_bucket and _SELF_MANAGED_BUCKET_NAME:
+            cls.bucket_name = _SELF_MANAGED_BUCKET_NAME
+        if not cls.pre_created_ecr_repo and _SELF_MANAGED_ECR_REPO_URI:
+            cls.ecr_repo_name = _SELF_MANAGED_ECR_REPO_URI
         cls.test_data_path = Path(__file__).resolve().parents[1].joinpath("testdata", "package")
 
         # Intialize S3 client
@@ -65,16 +78,18 @@ class PackageIntegBase(TestCase):
         cls.kms_key = os.environ.get("AWS_KMS_KEY")
         # Use a pre-created S3 Bucket if present else create a new one
         cls.s3_bucket = s3.Bucket(cls.bucket_name)
-        if not cls.pre_created_bucket:
+        if not cls.pre_created_bucket and not _SELF_MANAGED_BUCKET_NAME:
             cls.s3_bucket.create()
             time.sleep(SLEEP)
             bucket_versioning = s3.BucketVersioning(cls.bucket_name)
             bucket_versioning.enable()
             time.sleep(SLEEP)
-        if not cls.pre_created_ecr_repo:
+            _SELF_MANAGED_BUCKET_NAME = cls.bucket_name
+        if not cls.pre_created_ecr_repo and not _SELF_MANAGED_ECR_REPO_URI:
             ecr_result = cls.ecr.create_repository(repositoryName=cls.ecr_repo_name)
             cls.ecr_repo_name = ecr_result.get("repository", {}).get("repositoryUri", None)
             time.sleep(SLEEP)
+            _SELF_MANAGED_ECR_REPO_URI = cls.ecr_repo_name
 
     def setUp(self):
         self.s3_prefix = uuid.uuid4().hex
@@ -5,6 +5,7 @@ import json
 import shutil
 import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import boto3
@@ -30,15 +31,35 @@ class SyncIntegBase(BuildIntegBase, PackageIntegBase):
 
         cls.test_data_path = Path(__file__).resolve().parents[1].joinpath("testdata", "sync")
 
+        # Poll CFN every few seconds instead of the default 30 so syncs return shortly
+        # after each stack transition; the CLI subprocess inherits this environment.
+        # The previous value is restored in tearDownClass so non-sync test classes
+        # in the same run keep the default polling rate
+        cls._previous_poll_delay = os.environ.get("SAM_CLI_POLL_DELAY")
+        os.environ.setdefault("SAM_CLI_POLL_DELAY", "3")
+
+        # Clients and the upload prefix are invariant across the tests in a class,
+        # so set them up once instead of per test.
+        # Adaptive retries absorb throttling when tests fan out many API calls
+        client_config = Config(retries={"mode": "adaptive", "max_attempts": 10})
+        cls.cfn_client = boto3.client("cloudformation", config=client_config)
+        cls.ecr_client = boto3.client("ecr", config=client_config)
+        cls.lambda_client = boto3.client("lambda", config=client_config)
+        cls.api_client = boto3.client("apigateway", config=client_config)
+        cls.sfn_client = boto3.client("stepfunctions", config=client_config)
+        cls.sns_arn = os.environ.get("AWS_SNS")
+        cls.s3_prefix = uuid.uuid4().hex
+
+    @classmethod
+    def tearDownClass(cls):
+        if cls._previous_poll_delay is None:
+            os.environ.pop("SAM_CLI_POLL_DELAY", None)
+        else:
+            os.environ["SAM_CLI_POLL_DELAY"] = cls._previous_poll_delay
+        super().tearDownClass()
+
     def setUp(self):
-        self.cfn_client = boto3.client("cloudformation")
-        self.ecr_client = boto3.client("ecr")
-        self.lambda_client = boto3.client("lambda")
-        self.api_client = boto3.client("apigateway")
-        self.sfn_client = boto3.client("stepfunctions")
-        self.sns_arn = os.environ.get("AWS_SNS")
         self.stacks = []
-        self.s3_prefix = uuid.uuid4().hex
         super().setUp()
 
     def tearDown(self):
@@ -56,25 +77,38 @@ class SyncIntegBase(BuildIntegBase, PackageIntegBase):
                 cfn_client.delete_stack(StackName=stack_name)
         super().tearDown()
 
+    def _method_to_stack_name(self, method_name):
+        # Suffix the stack name with the xdist worker id so that parallel test
+        # workers don't collide on the same CFN stack
+        stack_name = super()._method_to_stack_name(method_name)
+        return f"{stack_name}-{os.environ.get('PYTEST_XDIST_WORKER', 'gw0')}"
+
     def _get_stacks(self, stack_name):
         physical_ids = {}
-        response = self.cfn_client.describe_stack_resources(StackName=stack_name).get("StackResources", {})
-        for resource in response:
-            resource_type = resource.get("ResourceType")
-            if resource_type == "AWS::CloudFormation::Stack":
-                nested_stack_physical_id = resource.get("PhysicalResourceId")
-                nested_stack_name = nested_stack_physical_id.split("/")[1]
-                nested_stack_physical_ids = self._get_stacks(nested_stack_name)
-                for nested_resource_type, nested_physical_ids in nested_stack_physical_ids.items():
-                    if nested_resource_type not in physical_ids:
-                        physical_ids[nested_resource_type] = []
-                    physical_ids[nested_resource_type] += nested_physical_ids
-                continue
-            if resource_type not in physical_ids:
-                physical_ids[resource.get("ResourceType")] = []
-            physical_ids[resource_type].append(resource.get("PhysicalResourceId"))
+        # Paginate so one listing covers the whole stack regardless of its size
+        paginator = self.cfn_client.get_paginator("list_stack_resources")
+        for page in paginator.paginate(StackName=stack_name):
+            for resource in page.get("StackResourceSummaries", []):
+                resource_type = resource.get("ResourceType")
+                if resource_type == "AWS::CloudFormation::Stack":
+                    nested_stack_physical_id = resource.get("PhysicalResourceId")
+                    nested_stack_name = nested_stack_physical_id.split("/")[1]
+                    nested_stack_physical_ids = self._get_stacks(nested_stack_name)
+                    for nested_resource_type, nested_physical_ids in nested_stack_physical_ids.items():
+                        if nested_resource_type not in physical_ids:
+                            physical_ids[nested_resource_type] = []
+                        physical_ids[nested_resource_type] += nested_physical_ids
+                    continue
+                if resource_type not in physical_ids:
+                    physical_ids[resource.get("ResourceType")] = []
+                physical_ids[resource_type].append(resource.get("PhysicalResourceId"))
         return physical_ids
 
+    def _get_lambda_responses(self, lambda_functions):
+        # Invoke the functions in parallel, the calls are dominated by network wait
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            return list(executor.map(self._get_lambda_response, lambda_functions))
+
     def _get_lambda_response(self, lambda_function):
         count = 0
         while count < RETRY_ATTEMPTS:
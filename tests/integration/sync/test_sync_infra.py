@@ -30,11 +30,91 @@ API_SLEEP = 5
 SFN_SLEEP = 5
 CFN_PYTHON_VERSION_SUFFIX = os.environ.get("PYTHON_VERSION", "0.0.0").replace(".", "-")
 
+# Resolve template paths once at import time. Parameterized arguments stay short
+# relative names: they feed self.id() and through it the CFN stack name, which
+# must remain under CFN's 128 character limit regardless of the checkout path
+TEST_DATA_PATH = Path(__file__).resolve().parents[1].joinpath("testdata", "sync")
+INFRA_TEMPLATE_PATHS = {
+    runtime: (
+        str(TEST_DATA_PATH.joinpath("infra", f"template-{runtime}-before.yaml")),
+        str(TEST_DATA_PATH.joinpath("infra", f"template-{runtime}-after.yaml")),
+    )
+    for runtime in ("ruby", "python")
+}
+
+# CDK templates are resolved inside each test against its temp copy of the
+# cdk tree, so these cases carry file names rather than absolute paths
+CDK_TEMPLATE_CASES = [
+    (
+        "cdk_v1_synthesized_template_zip_functions.json",
+        "cdk_v1_synthesized_template_zip_functions_after.json",
+        None,
+        False,
+    ),
+    (
+        "cdk_v1_synthesized_template_zip_functions.json",
+        "cdk_v1_synthesized_template_zip_functions_after.json",
+        None,
+        True,
+    ),
+    (
+        "cdk_v1_synthesized_template_Level1_nested_zip_functions.json",
+        "cdk_v1_synthesized_template_Level1_nested_zip_functions_after.json",
+        None,
+        False,
+    ),
+    (
+        "cdk_v1_synthesized_template_image_functions.json",
+        "cdk_v1_synthesized_template_image_functions_after.json",
+        "ColorsRandomFunctionF61B9209",
+        False,
+    ),
+    (
+        "cdk_v1_synthesized_template_image_functions.json",
+        "cdk_v1_synthesized_template_image_functions_after.json",
+        "ColorsRandomFunction",
+        False,
+    ),
+    (
+        "cdk_v1_synthesized_template_Level1_nested_image_functions.json",
+        "cdk_v1_synthesized_template_Level1_nested_image_functions_after.json",
+        "ColorsRandomFunctionF61B9209",
+        False,
+    ),
+    (
+        "cdk_v1_synthesized_template_Level1_nested_image_functions.json",
+        "cdk_v1_synthesized_template_Level1_nested_image_functions_after.json",
+        "ColorsRandomFunction",
+        False,
+    ),
+    (
+        "cdk_v1_synthesized_template_Level1_nested_image_functions.json",
+        "cdk_v1_synthesized_template_Level1_nested_image_functions_after.json",
+        "Level1Stack/Level2Stack/ColorsRandomFunction",
+        False,
+    ),
+]
+
 LOG = logging.getLogger(__name__)
 
 
 @skipIf(SKIP_SYNC_TESTS, "Skip sync tests in CI/CD only")
 class TestSyncInfra(SyncIntegBase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # The CDK asset tree is large; copy it once and let each test hard-link
+        # from this cache instead of copying the whole tree again
+        cls.cdk_template_cache = tempfile.mkdtemp()
+        shutil.copytree(
+            str(cls.test_data_path.joinpath("infra", "cdk")), str(Path(cls.cdk_template_cache).joinpath("cdk"))
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls.cdk_template_cache, ignore_errors=True)
+        super().tearDownClass()
+
     @skipIf(
         IS_WINDOWS,
         "Skip sync ruby tests in windows",
@@ -45,14 +125,12 @@ class TestSyncInfra(SyncIntegBase):
         self._test_sync_infra(runtime)
 
     def _test_sync_infra(self, runtime):
-        template_before = f"infra/template-{runtime}-before.yaml"
-        template_path = str(self.test_data_path.joinpath(template_before))
+        template_path, template_after_path = INFRA_TEMPLATE_PATHS[runtime]
         stack_name = self._method_to_stack_name(self.id())
         self.stacks.append({"name": stack_name})
 
-        # Run infra sync
-        sync_command_list = self.get_sync_command_list(
-            template_file=template_path,
+        # Kwargs shared by both syncs; only the template file changes between them
+        common_args = dict(
             code=False,
             watch=False,
             dependency_layer=True,
@@ -64,16 +142,20 @@ class TestSyncInfra(SyncIntegBase):
             tags="integ=true clarity=yes foo_bar=baz",
         )
 
+        # Run infra sync
+        sync_command_list = self.get_sync_command_list(template_file=template_path, **common_args)
+
         sync_process_execute = run_command_with_input(sync_command_list, "y\n".encode())
+        stderr = sync_process_execute.stderr.decode(errors="replace")
         self.assertEqual(sync_process_execute.process.returncode, 0)
-        self.assertIn("Stack creation succeeded. Sync infra completed.", str(sync_process_execute.stderr))
+        self.assertIn("Stack creation succeeded. Sync infra completed.", stderr)
 
         # CFN Api call here to collect all the stack resources
         self.stack_resources = self._get_stacks(stack_name)
         # Lambda Api call here, which tests both the python function and the layer
         lambda_functions = self.stack_resources.get(AWS_LAMBDA_FUNCTION)
-        for lambda_function in lambda_functions:
-            lambda_response = json.loads(self._get_lambda_response(lambda_function))
+        for response_body in self._get_lambda_responses(lambda_functions):
+            lambda_response = json.loads(response_body)
             self.assertIn("extra_message", lambda_response)
             self.assertEqual(lambda_response.get("message"), "7")
         if runtime == "python":
@@ -84,34 +166,21 @@ class TestSyncInfra(SyncIntegBase):
             state_machine = self.stack_resources.get(AWS_STEPFUNCTIONS_STATEMACHINE)[0]
             self.assertEqual(self._get_sfn_response(state_machine), '"World has been updated!"')
 
-        template_after = f"infra/template-{runtime}-after.yaml"
-        template_path = str(self.test_data_path.joinpath(template_after))
-
         # Run infra sync
-        sync_command_list = self.get_sync_command_list(
-            template_file=template_path,
-            code=False,
-            watch=False,
-            dependency_layer=True,
-            stack_name=stack_name,
-            parameter_overrides="Parameter=Clarity",
-            image_repository=self.ecr_repo_name,
-            s3_prefix=self.s3_prefix,
-            kms_key_id=self.kms_key,
-            tags="integ=true clarity=yes foo_bar=baz",
-        )
+        sync_command_list = self.get_sync_command_list(template_file=template_after_path, **common_args)
 
         sync_process_execute = run_command_with_input(sync_command_list, "y\n".encode())
+        stderr = sync_process_execute.stderr.decode(errors="replace")
         self.assertEqual(sync_process_execute.process.returncode, 0)
-        self.assertIn("Stack update succeeded. Sync infra completed.", str(sync_process_execute.stderr))
-        self.assertNotIn("Commands you can use next", str(sync_process_execute.stderr))
+        self.assertIn("Stack update succeeded. Sync infra completed.", stderr)
+        self.assertNotIn("Commands you can use next", stderr)
 
         # CFN Api call here to collect all the stack resources
         self.stack_resources = self._get_stacks(stack_name)
         # Lambda Api call here, which tests both the python function and the layer
         lambda_functions = self.stack_resources.get(AWS_LAMBDA_FUNCTION)
-        for lambda_function in lambda_functions:
-            lambda_response = json.loads(self._get_lambda_response(lambda_function))
+        for response_body in self._get_lambda_responses(lambda_functions):
+            lambda_response = json.loads(response_body)
             self.assertIn("extra_message", lambda_response)
             self.assertEqual(lambda_response.get("message"), "9")
         if runtime == "python":
@@ -124,7 +193,7 @@ class TestSyncInfra(SyncIntegBase):
 
     @parameterized.expand(["infra/template-python-before.yaml"])
     def test_sync_infra_no_confirm(self, template_file):
-        template_path = str(self.test_data_path.joinpath(template_file))
+        template_path = str(TEST_DATA_PATH.joinpath(template_file))
         stack_name = self._method_to_stack_name(self.id())
 
         # Run infra sync
@@ -147,7 +216,7 @@ class TestSyncInfra(SyncIntegBase):
 
     @parameterized.expand(["infra/template-python-before.yaml"])
     def test_sync_infra_no_stack_name(self, template_file):
-        template_path = str(self.test_data_path.joinpath(template_file))
+        template_path = str(TEST_DATA_PATH.joinpath(template_file))
 
         # Run infra sync
         sync_command_list = self.get_sync_command_list(
@@ -168,7 +237,7 @@ class TestSyncInfra(SyncIntegBase):
 
     @parameterized.expand(["infra/template-python-before.yaml"])
     def test_sync_infra_no_capabilities(self, template_file):
-        template_path = str(self.test_data_path.joinpath(template_file))
+        template_path = str(TEST_DATA_PATH.joinpath(template_file))
         stack_name = self._method_to_stack_name(self.id())
         self.stacks.append({"name": stack_name})
 
@@ -195,72 +264,26 @@ Requires capabilities : [CAPABILITY_AUTO_EXPAND]",
             str(sync_process_execute.stderr),
         )
 
-    @parameterized.expand(
-        [
-            (
-                "cdk_v1_synthesized_template_zip_functions.json",
-                "cdk_v1_synthesized_template_zip_functions_after.json",
-                None,
-                False,
-            ),
-            (
-                "cdk_v1_synthesized_template_zip_functions.json",
-                "cdk_v1_synthesized_template_zip_functions_after.json",
-                None,
-                True,
-            ),
-            (
-                "cdk_v1_synthesized_template_Level1_nested_zip_functions.json",
-                "cdk_v1_synthesized_template_Level1_nested_zip_functions_after.json",
-                None,
-                False,
-            ),
-            (
-                "cdk_v1_synthesized_template_image_functions.json",
-                "cdk_v1_synthesized_template_image_functions_after.json",
-                "ColorsRandomFunctionF61B9209",
-                False,
-            ),
-            (
-                "cdk_v1_synthesized_template_image_functions.json",
-                "cdk_v1_synthesized_template_image_functions_after.json",
-                "ColorsRandomFunction",
-                False,
-            ),
-            (
-                "cdk_v1_synthesized_template_Level1_nested_image_functions.json",
-                "cdk_v1_synthesized_template_Level1_nested_image_functions_after.json",
-                "ColorsRandomFunctionF61B9209",
-                False,
-            ),
-            (
-                "cdk_v1_synthesized_template_Level1_nested_image_functions.json",
-                "cdk_v1_synthesized_template_Level1_nested_image_functions_after.json",
-                "ColorsRandomFunction",
-                False,
-            ),
-            (
-                "cdk_v1_synthesized_template_Level1_nested_image_functions.json",
-                "cdk_v1_synthesized_template_Level1_nested_image_functions_after.json",
-                "Level1Stack/Level2Stack/ColorsRandomFunction",
-                False,
-            ),
-        ]
-    )
+    @parameterized.expand(CDK_TEMPLATE_CASES)
     def test_cdk_templates(self, template_file, template_after, function_id, dependency_layer):
         repository = ""
         if function_id:
             repository = f"{function_id}={self.ecr_repo_name}"
         with tempfile.TemporaryDirectory() as temp:
             temp_path = Path(temp)
-            shutil.copytree(str(self.test_data_path.joinpath("infra/cdk")), str(temp_path.joinpath("cdk")))
+            # Hard-link the cached CDK tree into the test's temp dir; unchanged
+            # files cost one inode link each instead of a full copy
+            shutil.copytree(
+                str(Path(self.cdk_template_cache).joinpath("cdk")),
+                str(temp_path.joinpath("cdk")),
+                copy_function=os.link,
+            )
             template_path = str(temp_path.joinpath("cdk").joinpath(template_file))
             stack_name = self._method_to_stack_name(self.id())
             self.stacks.append({"name": stack_name})
 
-            # Run infra sync
-            sync_command_list = self.get_sync_command_list(
-                template_file=template_path,
+            # Kwargs shared by both syncs; only the template file changes between them
+            common_args = dict(
                 code=False,
                 watch=False,
                 dependency_layer=dependency_layer,
@@ -271,44 +294,38 @@ Requires capabilities : [CAPABILITY_AUTO_EXPAND]",
                 kms_key_id=self.kms_key,
                 tags="integ=true clarity=yes foo_bar=baz",
             )
+
+            # Run infra sync
+            sync_command_list = self.get_sync_command_list(template_file=template_path, **common_args)
             sync_process_execute = run_command_with_input(sync_command_list, "y\n".encode())
+            stderr = sync_process_execute.stderr.decode(errors="replace")
             self.assertEqual(sync_process_execute.process.returncode, 0)
-            self.assertIn("Stack creation succeeded. Sync infra completed.", str(sync_process_execute.stderr))
+            self.assertIn("Stack creation succeeded. Sync infra completed.", stderr)
 
             # CFN Api call here to collect all the stack resources
             self.stack_resources = self._get_stacks(stack_name)
             # Lambda Api call here, which tests both the python function and the layer
             lambda_functions = self.stack_resources.get(AWS_LAMBDA_FUNCTION)
-            for lambda_function in lambda_functions:
-                lambda_response = json.loads(self._get_lambda_response(lambda_function))
+            for response_body in self._get_lambda_responses(lambda_functions):
+                lambda_response = json.loads(response_body)
                 self.assertIn("extra_message", lambda_response)
                 self.assertEqual(lambda_response.get("message"), "7")
 
             template_path = str(temp_path.joinpath("cdk").joinpath(template_after))
 
             # Run infra sync
-            sync_command_list = self.get_sync_command_list(
-                template_file=template_path,
-                code=False,
-                watch=False,
-                dependency_layer=dependency_layer,
-                stack_name=stack_name,
-                parameter_overrides="Parameter=Clarity",
-                image_repositories=repository,
-                s3_prefix=self.s3_prefix,
-                kms_key_id=self.kms_key,
-                tags="integ=true clarity=yes foo_bar=baz",
-            )
+            sync_command_list = self.get_sync_command_list(template_file=template_path, **common_args)
 
             sync_process_execute = run_command_with_input(sync_command_list, "y\n".encode())
+            stderr = sync_process_execute.stderr.decode(errors="replace")
             self.assertEqual(sync_process_execute.process.returncode, 0)
-            self.assertIn("Stack update succeeded. Sync infra completed.", str(sync_process_execute.stderr))
+            self.assertIn("Stack update succeeded. Sync infra completed.", stderr)
 
             # CFN Api call here to collect all the stack resources
             self.stack_resources = self._get_stacks(stack_name)
             # Lambda Api call here, which tests both the python function and the layer
             lambda_functions = self.stack_resources.get(AWS_LAMBDA_FUNCTION)
-            for lambda_function in lambda_functions:
-                lambda_response = json.loads(self._get_lambda_response(lambda_function))
+            for response_body in self._get_lambda_responses(lambda_functions):
+                lambda_response = json.loads(response_body)
                 self.assertIn("extra_message", lambda_response)
                 self.assertEqual(lambda_response.get("message"), "9")
@@ -635,6 +635,41 @@ class TestDeployer(TestCase):
         with self.assertRaises(DeployFailedError):
             self.deployer.wait_for_execute("test", "CREATE", False)
 
+    @patch("time.sleep")
+    def test_wait_for_execute_default_waiter_config(self, patched_time):
+        self.deployer.describe_stack_events = MagicMock()
+        self.deployer.get_stack_outputs = MagicMock(return_value=None)
+        waiter = MagicMock()
+        self.deployer._client.get_waiter = MagicMock(return_value=waiter)
+
+        self.deployer.wait_for_execute("test", "CREATE", False)
+        waiter.wait.assert_called_with(StackName="test", WaiterConfig={"Delay": 30, "MaxAttempts": 120})
+
+    @patch("time.sleep")
+    def test_wait_for_execute_poll_delay_override(self, patched_time):
+        self.deployer.describe_stack_events = MagicMock()
+        self.deployer.get_stack_outputs = MagicMock(return_value=None)
+        waiter = MagicMock()
+        self.deployer._client.get_waiter = MagicMock(return_value=waiter)
+
+        # Attempts scale with the delay so the total wait time stays at least an hour
+        with patch.dict("os.environ", {"SAM_CLI_POLL_DELAY": "3"}):
+            self.deployer.wait_for_execute("test", "CREATE", False)
+        waiter.wait.assert_called_with(StackName="test", WaiterConfig={"Delay": 3, "MaxAttempts": 1200})
+
+    @patch("time.sleep")
+    def test_wait_for_execute_invalid_poll_delay(self, patched_time):
+        self.deployer.describe_stack_events = MagicMock()
+        self.deployer.get_stack_outputs = MagicMock(return_value=None)
+        waiter = MagicMock()
+        self.deployer._client.get_waiter = MagicMock(return_value=waiter)
+
+        # Garbage and non-positive values fall back to the 30s default
+        for poll_delay in ("not-a-number", "0", "-5"):
+            with patch.dict("os.environ", {"SAM_CLI_POLL_DELAY": poll_delay}):
+                self.deployer.wait_for_execute("test", "CREATE", False)
+            waiter.wait.assert_called_with(StackName="test", WaiterConfig={"Delay": 30, "MaxAttempts": 120})
+
     def test_create_and_wait_for_changeset(self):
         self.deployer.create_changeset = MagicMock(return_value=({"Id": "test"}, "create"))
         self.deployer.wait_for_changeset = MagicMock()